@@ -18,7 +18,7 @@ from .base.models_base import ModelException, SASTRE_ROOT_DIR
 from .__version__ import __version__ as version
 from .__version__ import __doc__ as title
 from .tasks.utils import TaskOptions, EnvVar, non_empty_type, PromptArg
-from .tasks.common import Task, TaskException
+from .tasks.common import Task, TaskException, Table
 from .tasks import implementation
 
 # vManage REST API defaults
@@ -95,11 +95,19 @@ def execute_task(task_obj: Task, parsed_task_args, is_api_task: bool, base_url:
 
         # Display task output
         if task_output:
-            print('\n\n'.join(str(entry) for entry in task_output))
+            for entry_num, entry in enumerate(task_output):
+                if entry_num != 0:
+                    sys.stdout.write('\n\n')
+                if isinstance(entry, Table):
+                    entry.write_to(sys.stdout)
+                else:
+                    sys.stdout.write(str(entry))
+            sys.stdout.write('\n')
 
         # Display dryrun report if console logging is disabled (i.e. not in verbose mode)
         if not is_verbose and task_obj.is_dryrun:
-            print(str(task_obj.dryrun_report))
+            task_obj.dryrun_report.write_to(sys.stdout)
+            sys.stdout.write('\n')
 
         task_obj.log_info(f'Task completed {task_obj.outcome("successfully", "with caveats: {tally}")}')
     except (RestAPIException, ConnectionError, HTTPError, FileNotFoundError, ModelException, TaskException) as ex:
@@ -533,6 +533,20 @@ def attribute_safe(raw_attribute):
     return re.sub(r'\W', '_', raw_attribute, flags=re.ASCII)
 
 
+def json_cmp(local_obj: Any, other_obj: Any) -> bool:
+    """
+    Compare the JSON encodings of local_obj and other_obj, insensitive to the order of their characters
+    @return: True if both JSON strings contain the same characters
+    """
+    local_json, other_json = json.dumps(local_obj), json.dumps(other_obj)
+    if local_json == other_json:
+        return True
+    if len(local_json) != len(other_json):
+        return False
+
+    return sorted(local_json) == sorted(other_json)
+
+
 class ApiItem:
     """
     ApiItem represents a vManage API element defined by an ApiPath with GET, POST, PUT and DELETE paths. An instance
@@ -645,7 +659,7 @@ class ConfigItem(ApiItem):
         local_cmp_dict = {k: v for k, v in self.data.items() if k not in exclude_set}
         other_cmp_dict = {k: v for k, v in other_payload.items() if k not in exclude_set}
 
-        return sorted(json.dumps(local_cmp_dict)) == sorted(json.dumps(other_cmp_dict))
+        return json_cmp(local_cmp_dict, other_cmp_dict)
 
     @property
     def is_readonly(self):
@@ -939,7 +953,7 @@ class Config2Item(ConfigItem):
         local_cmp_dict = put_model(**self.data).model_dump(by_alias=True, exclude=exclude_set, exclude_defaults=True)
         other_cmp_dict = {k: v for k, v in other.items() if k not in exclude_set}
 
-        return sorted(json.dumps(local_cmp_dict)) == sorted(json.dumps(other_cmp_dict))
+        return json_cmp(local_cmp_dict, other_cmp_dict)
 
     def post_data(self, id_mapping_dict: Optional[Mapping[str, str]] = None) -> dict[str, Any]:
         """
@@ -1223,6 +1237,8 @@ class ExtendedTemplate:
     def __init__(self, name_regex: str):
         self.src_template = name_regex
         self.label_value_map = None
+        # Names already transformed by this template: {<name>: <new name>}
+        self.name_cache = {}
 
     def __call__(self, name: str) -> str:
         """
@@ -1230,7 +1246,16 @@ class ExtendedTemplate:
         @param name: Current item name
         @return: New name from item name using the name_regex
         """
+        result_name = self.name_cache.get(name)
+        if result_name is None:
+            result_name = self.name_cache[name] = self.transform(name)
+
+        return result_name
 
+    def transform(self, name: str) -> str:
+        """
+        Build new name from item name using the name_regex, bypassing the name cache
+        """
         def regex_replace(match_obj):
             regex = match_obj.group('regex')
             if regex is not None:
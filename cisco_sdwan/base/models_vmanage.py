@@ -429,6 +429,10 @@ class DeviceTemplateAttached(IndexConfigItem):
     store_file = '{item_name}.json'
     iter_fields = ('uuid', 'personality')
 
+    @property
+    def uuids(self) -> Iterable[str]:
+        return (entry['uuid'] for entry in self.data if 'uuid' in entry)
+
 
 # This is a special case handled under DeviceTemplate
 class DeviceTemplateValues(ConfigItem):
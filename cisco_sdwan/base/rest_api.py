@@ -6,6 +6,7 @@
 """
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import functools
 import logging
 from urllib3 import disable_warnings
@@ -17,6 +18,9 @@ from random import uniform
 
 
 MAX_RETRIES = 10
+# Max connections kept open to vManage, should be no lower than the number of threads issuing concurrent requests.
+# Task thread pools have at most 10 workers and are not nested.
+SESSION_POOL_SIZE = 16
 
 
 def backoff_wait_secs(retry_count: int, ceiling: int = 5, variance: float = 0.25) -> float:
@@ -79,6 +83,9 @@ class Rest:
         }
 
         session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=SESSION_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         response = session.post(f'{self.base_url}/j_security_check',
                                 data=data, timeout=self.timeout, verify=self.verify)
         response.raise_for_status()
@@ -204,6 +211,7 @@ def raise_for_status(response):
                                f'{": " if details else ""}{details} [{response.request.method} {response.url}]')
 
 
+@functools.lru_cache(maxsize=128)
 def is_version_newer(version_1: str, version_2: str) -> bool:
     """
     Indicates whether one vManage version is newer than another. Compares only the first 2 digits from version
@@ -5,19 +5,23 @@
  This module implements supporting classes and functions for tasks
 """
 import logging
+import os
 import time
 import csv
 import re
 import json
+import io
+from concurrent import futures
 from pathlib import Path
 from shutil import rmtree
+from itertools import chain
 from collections import namedtuple
-from typing import Union, Optional, Any, TypeVar
-from collections.abc import Sequence, Mapping, Iterator, Iterable
+from typing import Union, Optional, Any, TypeVar, TextIO
+from collections.abc import Sequence, Mapping, Iterator, Iterable, Callable
 from zipfile import ZipFile, ZIP_DEFLATED
 from pydantic import ValidationError
 from cisco_sdwan.base.rest_api import Rest, RestAPIException
-from cisco_sdwan.base.models_base import DATA_DIR
+from cisco_sdwan.base.models_base import DATA_DIR, ConfigItem, ModelException
 from cisco_sdwan.base.models_vmanage import (DeviceTemplate, DeviceTemplateValues, DeviceTemplateAttached,
                                              DeviceTemplateAttach, DeviceTemplateCLIAttach, DeviceModeCli,
                                              ActionStatus, PolicyVsmartStatus, PolicyVsmartStatusException,
@@ -27,29 +31,83 @@ from cisco_sdwan.base.models_vmanage import (DeviceTemplate, DeviceTemplateValue
 T = TypeVar('T')
 
 
-def regex_search(regex: str, *fields: str, inverse: bool = False) -> bool:
+def regex_search(regex: Union[str, re.Pattern], *fields: str, inverse: bool = False) -> bool:
     """
     Execute regular expression search on provided fields. Match fields in the order provided. Behavior is determined
     by the inverse field. With inverse False (default), returns True (i.e. match) if pattern matches any field. When
     inverse is True, returns True if pattern does not match all fields
-    @param regex: Pattern to match
+    @param regex: Pattern to match, either as a string or as a pre-compiled pattern
     @param fields: One or more strings to match
     @param inverse: False (default), or True to invert the match behavior.
     @return: True if a match is found on any field, False otherwise.
     """
-    op_fn = all if inverse else any  # Logical AND across all fields, else logical OR
-    return op_fn(inverse ^ bool(re.search(regex, match_field)) for match_field in fields)
+    pattern = re.compile(regex)
+    if inverse:
+        # Logical AND across all fields, any match is a no-match
+        for match_field in fields:
+            if pattern.search(match_field) is not None:
+                return False
+        return True
+
+    # Logical OR across all fields, any match is a match
+    for match_field in fields:
+        if pattern.search(match_field) is not None:
+            return True
+    return False
 
 
 class Tally:
-    def __init__(self, *counters):
-        self._tally = {counter: 0 for counter in counters}
+    __slots__ = ('debug', 'info', 'warning', 'error', 'critical')
 
-    def __getattr__(self, counter):
-        return self._tally[counter]
+    def __init__(self, *counters):
+        for counter in counters:
+            setattr(self, counter, 0)
 
     def incr(self, counter):
-        self._tally[counter] += 1
+        setattr(self, counter, getattr(self, counter) + 1)
+
+
+class LazyStr:
+    def __init__(self, str_fn: Callable[..., str], *args):
+        """
+        Deferred string builder, used as a log message argument so that str_fn is only called if the message is emitted
+        @param str_fn: Function returning the string
+        @param args: Positional arguments passed to str_fn
+        """
+        self.str_fn = str_fn
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.str_fn(*self.args)
+
+
+class LazyDeviceMap(Mapping):
+    def __init__(self, api: Rest):
+        """
+        Mapping of {<uuid>: <name>, ...} with all devices in the inventory. The device inventory is only retrieved from
+        vManage on first access.
+        @param api: Instance of Rest API
+        """
+        self.api = api
+        self._devices_map = None
+
+    @property
+    def devices_map(self) -> dict[str, Optional[str]]:
+        if self._devices_map is None:
+            self._devices_map = dict(device_iter(self.api, default=None))
+        return self._devices_map
+
+    def __getitem__(self, uuid: str) -> Optional[str]:
+        return self.devices_map[uuid]
+
+    def __contains__(self, uuid: object) -> bool:
+        return uuid in self.devices_map
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.devices_map)
+
+    def __len__(self) -> int:
+        return len(self.devices_map)
 
 
 class TableFilter:
@@ -67,40 +125,69 @@ class TableFilter:
         self.regex_pattern = re.compile(regex)
         self.column = column
         self.inverse = inverse
+        self._row_match = self._row_match_fn()
 
-    def __call__(self, table_row: tuple) -> bool:
+    def _row_match_fn(self) -> Callable[[tuple], bool]:
         """
-        Callable used by 'Table.filtered' to evaluate whether a row should be allowed.
-        @return: True if row is allowed by the filter. False otherwise.
+        Build a row match function specialized to this filter's column, so that per-row evaluation does not need to
+        resolve filter attributes or branch on column.
+        @return: Function that returns True if the (non-marker) table row matches the pattern, False otherwise.
         """
+        search = self.regex_pattern.search
+        column = self.column
+
+        # When column is not provided, any column match is a row match. Cells that are None always match.
+        if column is None:
+            def row_match(table_row: tuple) -> bool:
+                for cell_value in table_row:
+                    if cell_value is None or search(str(cell_value)) is not None:
+                        return True
+                return False
 
-        def match_column(column_value) -> bool:
-            if column_value is None:
-                return True
+            return row_match
 
-            return self.regex_pattern.search(str(column_value)) is not None
+        # With column provided, match on that particular column is a row match
+        def column_match(table_row: tuple) -> bool:
+            cell_value = table_row[column]
+            return cell_value is None or search(str(cell_value)) is not None
 
+        return column_match
+
+    def __call__(self, table_row: tuple) -> bool:
+        """
+        Callable used by 'Table.filtered' to evaluate whether a row should be allowed.
+        @return: True if row is allowed by the filter. False otherwise.
+        """
         # Table row is None when that is a marker row
         if table_row is None:
             return True
 
-        # When column is not provided, any column match is a row match
-        if self.column is None:
-            return self.inverse ^ any(match_column(cell_value) for cell_value in table_row)
-
-        # With column provided, match on that particular column is a row match
-        return self.inverse ^ match_column(table_row[self.column])
+        return self.inverse ^ self._row_match(table_row)
 
 
 class Table:
     DECIMAL_DIGITS = 1  # Number of decimal digits for float values
 
-    def __init__(self, *columns: str, name: Optional[str] = None, meta: Optional[str] = None) -> None:
+    def __init__(self, *columns: str, name: Optional[str] = None, meta: Optional[str] = None,
+                 column_types: Optional[Sequence[type]] = None) -> None:
+        """
+        @param columns: Column titles
+        @param name: (optional) Table name
+        @param meta: (optional) Table metadata, e.g. filename to use when saving the table
+        @param column_types: (optional) Type of each column. When provided, float rounding is only applied to float
+                             columns. Otherwise, every cell value is inspected.
+        """
         self.header = tuple(columns)
         self.name = name
         self.meta = meta
+        self.column_types = column_types
         self._row_class = namedtuple('Row', (f'column_{i}' for i in range(len(columns))))
         self._rows = list()
+        self._content_count = 0  # Number of content rows, that is, excluding markers
+        if column_types is None:
+            self._float_columns = None
+        else:
+            self._float_columns = tuple(index for index, column_type in enumerate(column_types) if column_type is float)
 
     def filtered(self, *filter_fns: TableFilter):
         """
@@ -109,8 +196,9 @@ class Table:
         @param filter_fns: one or more TableFilter instances
         @return: New Table instance containing the filtered rows
         """
-        new_table = Table(*self.header, name=self.name, meta=self.meta)
+        new_table = Table(*self.header, name=self.name, meta=self.meta, column_types=self.column_types)
         new_table._rows = [row for row in self if all(filter_fn(row) for filter_fn in filter_fns)]
+        new_table._content_count = len(new_table._rows) - new_table._rows.count(None)
 
         return new_table
 
@@ -118,24 +206,48 @@ class Table:
     def process_value(value):
         return round(value, Table.DECIMAL_DIGITS) if isinstance(value, float) else value
 
+    def _new_row(self, row_values):
+        if self._float_columns is None:
+            return self._row_class(*map(self.process_value, row_values))
+
+        if not self._float_columns:
+            return self._row_class(*row_values)
+
+        row_values = list(row_values)
+        for index in self._float_columns:
+            row_values[index] = self.process_value(row_values[index])
+
+        return self._row_class(*row_values)
+
     def add(self, *row_values):
-        self._rows.append(self._row_class(*map(self.process_value, row_values)))
+        self._rows.append(self._new_row(row_values))
+        self._content_count += 1
 
     def add_marker(self):
         self._rows.append(None)
 
     def extend(self, row_values_iter):
-        self._rows.extend(self._row_class(*map(self.process_value, row_values)) for row_values in row_values_iter)
+        new_rows = [self._new_row(row_values) for row_values in row_values_iter]
+        self._rows.extend(new_rows)
+        self._content_count += len(new_rows)
 
     def __iter__(self):
         return iter(self._rows)
 
     def __len__(self):
-        total_len = len(self._rows) - self._rows.count(None)
-        return total_len if total_len > 0 else 0
+        return self._content_count
 
     def __str__(self):
-        return '\n'.join(self.pretty_iter())
+        buffer = io.StringIO()
+        self.write_to(buffer)
+        return buffer.getvalue()
+
+    def write_to(self, fp: TextIO) -> None:
+        """
+        Write the pretty-formatted table to a text stream, without building the whole string in memory
+        @param fp: Text stream to write to (e.g. sys.stdout)
+        """
+        write_lines(fp, self.pretty_iter())
 
     def _column_max_width(self, index):
         def cell_length(cell_value):
@@ -177,12 +289,13 @@ class Table:
             yield border_line
 
     def dict(self) -> dict:
+        fields = self._row_class._fields
         table_dict = {
             "header": {
                 "name": self.name or "",
-                "title": {column_id: title for column_id, title in zip(self._row_class._fields, self.header)}
+                "title": dict(zip(fields, self.header))
             },
-            "data": [row._asdict() for row in self._rows if row is not None]
+            "data": [dict(zip(fields, row)) for row in self._rows if row is not None]
         }
         return table_dict
 
@@ -196,6 +309,22 @@ class Table:
             writer.writerows(row for row in self._rows if row is not None)
 
 
+def write_lines(fp: TextIO, line_iter: Iterable[str]) -> None:
+    """
+    Write lines to a text stream, separated by newline. Equivalent to fp.write('\\n'.join(line_iter)), but lines are
+    written as they are produced.
+    @param fp: Text stream to write to
+    @param line_iter: Iterable of lines to write
+    """
+    is_first = True
+    for line in line_iter:
+        if is_first:
+            is_first = False
+        else:
+            fp.write('\n')
+        fp.write(line)
+
+
 def get_table_filters(exclude_regex: Optional[str], include_regex: Optional[str]) -> Sequence[TableFilter]:
     filters = []
     if exclude_regex is not None:
@@ -210,7 +339,8 @@ def filtered_tables(tables: Sequence[Table], *filter_fns: TableFilter) -> Sequen
     if not filter_fns:
         return tables
 
-    filtered_table_iter = (table.filtered(*filter_fns) for table in tables)
+    # Tables without content rows would be dropped anyway, skip filtering them
+    filtered_table_iter = (table.filtered(*filter_fns) for table in tables if table)
 
     return [filtered_table for filtered_table in filtered_table_iter if filtered_table]
 
@@ -233,21 +363,40 @@ class DryRunReport:
         yield ""
 
     def __str__(self) -> str:
-        return '\n'.join(self.render())
+        buffer = io.StringIO()
+        self.write_to(buffer)
+        return buffer.getvalue()
+
+    def write_to(self, fp: TextIO) -> None:
+        write_lines(fp, self.render())
 
 
 class Task:
     # Configuration parameters for wait_actions
+    ACTION_MIN_INTERVAL = 1  # seconds
     ACTION_INTERVAL = 10  # seconds
     ACTION_TIMEOUT = 1800  # 30 minutes
+    ACTION_POOL_SIZE = 10  # max concurrent action status requests
+
+    FETCH_POOL_SIZE = 10  # max concurrent requests when retrieving items, devices or indexes from vManage
 
     SAVINGS_FACTOR = 1
     DRYRUN_LEVELS = {'info', 'warning', 'error', 'critical'}
+    LOG_LEVELS = {
+        'debug': logging.DEBUG,
+        'info': logging.INFO,
+        'warning': logging.WARNING,
+        'error': logging.ERROR,
+        'critical': logging.CRITICAL
+    }
 
     def __init__(self):
-        self.log_count = Tally('debug', 'info', 'warning', 'error', 'critical')
+        self.log_count = Tally(*Task.LOG_LEVELS)
         self.is_dryrun = False
         self.dryrun_report = DryRunReport()
+        self._logger = logging.getLogger(type(self).__name__)
+        self._log_fns = {level: getattr(self._logger, level) for level in Task.LOG_LEVELS}
+        self._devices_map = None
 
     def log_debug(self, msg: str, *args, dryrun: bool = True) -> None:
         self._log('debug', msg, *args, dryrun=dryrun)
@@ -273,7 +422,8 @@ class Task:
         @param dryrun: Whether to include this message to the dryrun report. Messages are added to the dryrun report if
                        this flag is True, the task is in dryrun mode and the level is in DRYRUN_LEVELS.
         """
-        getattr(logging.getLogger(type(self).__name__), level)(f"DRY-RUN: {msg}" if self.is_dryrun else msg, *args)
+        if self._logger.isEnabledFor(Task.LOG_LEVELS[level]):
+            self._log_fns[level](f"DRY-RUN: {msg}" if self.is_dryrun else msg, *args)
         self.log_count.incr(level)
 
         if self.is_dryrun and dryrun and level in Task.DRYRUN_LEVELS:
@@ -346,6 +496,18 @@ class Task:
     def index_get(index_cls: type[T], backend: Union[Rest, str]) -> Union[T, None]:
         return index_cls.get(backend) if isinstance(backend, Rest) else index_cls.load(backend)
 
+    def devices_map(self, api: Rest) -> Mapping[str, Optional[str]]:
+        """
+        Mapping of all devices in the inventory, shared by task methods so that the inventory is retrieved from vManage
+        at most once per task run and api session. Tasks do not add or remove devices, so the cached inventory is not
+        invalidated during the task run.
+        @param api: Instance of Rest API
+        @return: Mapping of {<uuid>: <name>, ...}. Name may be None if device has no hostname yet.
+        """
+        if self._devices_map is None or self._devices_map.api is not api:
+            self._devices_map = LazyDeviceMap(api)
+        return self._devices_map
+
     def template_attach_data(self, api: Rest, workdir: str, ext_name: bool, templates_iter: Iterable[tuple],
                              target_uuid_set: Optional[set] = None) -> tuple[list, bool]:
         """
@@ -360,6 +522,15 @@ class Task:
                                 When absent, re-attach all currently attached devices on target.
         @return: Tuple containing attach data (<template input list>, <isEdited>)
         """
+        target_attached_cache = {}  # {<target_template_id>: {<device uuid>, ...}}
+
+        def target_attached_uuids(target_id: str) -> set:
+            attached_uuid_set = target_attached_cache.get(target_id)
+            if attached_uuid_set is None:
+                attached_uuid_set = set(DeviceTemplateAttached.get_raise(api, target_id).uuids)
+                target_attached_cache[target_id] = attached_uuid_set
+
+            return attached_uuid_set
 
         def load_template_input(template_name: str, saved_id: str, target_id: str) -> Union[list, None]:
             if target_id is None:
@@ -374,7 +545,7 @@ class Task:
                 self.log_debug(f'Skip {template_name}, saved template has no attachments')
                 return None
 
-            target_attached_uuid_set = {uuid for uuid, _ in DeviceTemplateAttached.get_raise(api, target_id)}
+            target_attached_uuid_set = target_attached_uuids(target_id)
             if target_uuid_set is None:
                 allowed_uuid_set = target_attached_uuid_set
             else:
@@ -382,7 +553,7 @@ class Task:
                 if saved_attached is None:
                     self.log_error(f'DeviceTemplateAttached file not found: {template_name}, {saved_id}')
                     return None
-                saved_attached_uuid_set = {uuid for uuid, _ in saved_attached}
+                saved_attached_uuid_set = set(saved_attached.uuids)
                 allowed_uuid_set = target_uuid_set & saved_attached_uuid_set - target_attached_uuid_set
 
             input_list = saved_values.input_list(allowed_uuid_set)
@@ -411,7 +582,7 @@ class Task:
         """
 
         def get_template_input(template_id):
-            uuid_list = [uuid for uuid, _ in DeviceTemplateAttached.get_raise(api, template_id)]
+            uuid_list = list(DeviceTemplateAttached.get_raise(api, template_id).uuids)
             values = DeviceTemplateValues(api.post(DeviceTemplateValues.api_params(template_id, uuid_list),
                                                    DeviceTemplateValues.api_path.post))
             return values.input_list()
@@ -438,18 +609,15 @@ class Task:
         @return: Number of attachment requests processed
         """
 
-        def grouper(attach_cls, request_list):
-            while True:
-                section_dict = yield from chopper(chunk_size)
-                if not section_dict:
-                    continue
-
-                request_list.append(...)
-                attach_request_details = (
-                    f"{template_name} ({', '.join(DeviceTemplateValues.input_list_devices(input_list))})"
-                    for template_name, key_dict in section_dict.items() for input_list in key_dict.values()
-                )
-                self.log_info(f'Template attach: {", ".join(attach_request_details)}')
+        def attach(attach_cls, attach_data_iter) -> int:
+            attach_entry_iter = (
+                (template_name, template_id, input_entry)
+                for template_name, template_id, input_list in attach_data_iter for input_entry in input_list
+            )
+            attach_reqs = 0
+            for section_dict in chopped_iter(attach_entry_iter, chunk_size):
+                attach_reqs += 1
+                self.log_info('Template attach: %s', LazyStr(attach_request_details, section_dict))
 
                 if self.is_dryrun:
                     continue
@@ -464,30 +632,21 @@ class Task:
                 self.log_debug(f'Device template attach requested: {action_worker.uuid}')
                 self.wait_actions(api, [(action_worker, ', '.join(section_dict))], log_context, raise_on_failure)
 
-        def feeder(attach_cls, attach_data_iter):
-            attach_reqs = []
-            group = grouper(attach_cls, attach_reqs)
-            next(group)
-            for template_name, template_id, input_list in attach_data_iter:
-                for input_entry in input_list:
-                    group.send((template_name, template_id, input_entry))
-            group.send(None)
-
             return attach_reqs
 
         # Attach requests for feature-based device templates
         feature_based_iter = ((template_name, template_id, input_list)
                               for template_name, template_id, input_list, is_cli in template_input_list
                               if input_list is not None and not is_cli)
-        feature_based_reqs = feeder(DeviceTemplateAttach, feature_based_iter)
+        feature_based_reqs = attach(DeviceTemplateAttach, feature_based_iter)
 
         # Attach Requests for cli device templates
         cli_based_iter = ((template_name, template_id, input_list)
                           for template_name, template_id, input_list, is_cli in template_input_list
                           if input_list is not None and is_cli)
-        cli_based_reqs = feeder(DeviceTemplateCLIAttach, cli_based_iter)
+        cli_based_reqs = attach(DeviceTemplateCLIAttach, cli_based_iter)
 
-        return len(feature_based_reqs + cli_based_reqs)
+        return feature_based_reqs + cli_based_reqs
 
     def cfg_group_deploy_data(self, api: Rest, workdir: str, ext_name: bool,
                               cfg_group_iter: Iterable[tuple[str, str, Union[str, None]]],
@@ -514,7 +673,11 @@ class Task:
             already_associated_uuids = set(
                 ConfigGroupAssociated.get_raise(api, configGroupId=config_grp_target_id).uuids
             )
-            diff_associated = saved_associated.filter(devices_map.keys() - already_associated_uuids, not_by_rule=True)
+            # Candidates are taken from saved_associated, as opposed to the typically much larger devices_map
+            allowed_uuids = {
+                uuid for uuid in saved_associated.uuids if uuid in devices_map and uuid not in already_associated_uuids
+            }
+            diff_associated = saved_associated.filter(allowed_uuids, not_by_rule=True)
             if diff_associated.is_empty:
                 self.log_debug(f"Skip config-group {config_grp_name} associate, no devices to associate")
                 return False
@@ -609,40 +772,31 @@ class Task:
         @return: Number of deploy requests processed
         """
 
-        def grouper(request_list):
-            while True:
-                section_dict = yield from chopper(chunk_size)
-                if not section_dict:
-                    continue
-
-                wait_list = []
-                for group_id, key_dict in section_dict.items():
-                    request_list.append(...)
-                    self.log_info(f'Config-group deploy: {request_details(key_dict, devices_map)}')
-
-                    if self.is_dryrun:
-                        continue
-
-                    action_worker = ConfigGroupDeploy(
-                        api.post(ConfigGroupDeploy.api_params(uuid for uuids in key_dict.values() for uuid in uuids),
-                                 ConfigGroupDeploy.api_path.resolve(configGroupId=group_id).post)
-                    )
-                    wait_list.append((action_worker, ', '.join(key_dict)))
-                    self.log_debug(f'Config-group deploy requested: {action_worker.uuid}')
+        deploy_entry_iter = (
+            (config_grp_id, config_grp_name, device_id)
+            for config_grp_id, config_grp_name, device_id_list in deploy_data for device_id in device_id_list
+        )
+        deploy_reqs = 0
+        for section_dict in chopped_iter(deploy_entry_iter, chunk_size):
+            wait_list = []
+            for group_id, key_dict in section_dict.items():
+                deploy_reqs += 1
+                self.log_info('Config-group deploy: %s', LazyStr(request_details, key_dict, devices_map))
 
-                if wait_list:
-                    self.wait_actions(api, wait_list, log_context, raise_on_failure)
+                if self.is_dryrun:
+                    continue
 
-        deploy_reqs = []
-        group = grouper(deploy_reqs)
-        next(group)
+                action_worker = ConfigGroupDeploy(
+                    api.post(ConfigGroupDeploy.api_params(chain.from_iterable(key_dict.values())),
+                             ConfigGroupDeploy.api_path.resolve(configGroupId=group_id).post)
+                )
+                wait_list.append((action_worker, ', '.join(key_dict)))
+                self.log_debug(f'Config-group deploy requested: {action_worker.uuid}')
 
-        for config_grp_id, config_grp_name, device_id_list in deploy_data:
-            for device_id in device_id_list:
-                group.send((config_grp_id, config_grp_name, device_id))
-        group.send(None)
+            if wait_list:
+                self.wait_actions(api, wait_list, log_context, raise_on_failure)
 
-        return len(deploy_reqs)
+        return deploy_reqs
 
     def template_detach(self, api: Rest, template_iter: Iterable[tuple[str, str]],
                         devices_map: Optional[Mapping[str, str]] = None, *,
@@ -659,48 +813,48 @@ class Task:
         @return: Number of detach requests processed
         """
 
-        def grouper(request_list):
-            while True:
-                section_dict = yield from chopper(chunk_size)
-                if not section_dict:
-                    continue
-
-                wait_list = []
-                for device_type, key_dict in section_dict.items():
-                    request_list.append(...)
-                    self.log_info(f'Template detach: {request_details(key_dict, devices_map)}')
-
-                    if self.is_dryrun:
-                        continue
+        if devices_map is None:
+            devices_map = self.devices_map(api)
 
-                    uuid_iter = (uuid for device_id_list in key_dict.values() for uuid in device_id_list)
-                    action_worker = DeviceModeCli(
-                        api.post(DeviceModeCli.api_params(device_type, *uuid_iter), DeviceModeCli.api_path.post)
-                    )
-                    wait_list.append((action_worker, ', '.join(key_dict)))
-                    self.log_debug(f'Device template attach requested: {action_worker.uuid}')
+        def attached_devices(template_entry: tuple[str, str]) -> tuple[str, Optional[DeviceTemplateAttached]]:
+            template_id, template_name = template_entry
+            return template_name, DeviceTemplateAttached.get(api, template_id)
 
-                if wait_list:
-                    self.wait_actions(api, wait_list, log_context, raise_on_failure)
+        def detach_entry_iter(attached_iter: Iterable[tuple[str, Optional[DeviceTemplateAttached]]]):
+            for template_name, devices_attached in attached_iter:
+                if devices_attached is None:
+                    self.log_warning(f'Failed to retrieve {template_name} attached devices from vManage')
+                    continue
+                for device_id, personality in devices_attached:
+                    if device_id in devices_map:
+                        yield personality, template_name, device_id
+
+        # Attached devices are retrieved before any detach request, so that this thread pool is not running
+        # concurrently with the one from wait_actions
+        with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+            attached_iter = executor.map(attached_devices, template_iter)
+
+        detach_reqs = 0
+        for section_dict in chopped_iter(detach_entry_iter(attached_iter), chunk_size):
+            wait_list = []
+            for device_type, key_dict in section_dict.items():
+                detach_reqs += 1
+                self.log_info('Template detach: %s', LazyStr(request_details, key_dict, devices_map))
 
-        detach_reqs = []
-        group = grouper(detach_reqs)
-        next(group)
+                if self.is_dryrun:
+                    continue
 
-        if devices_map is None:
-            devices_map = dict(device_iter(api, default=None))
+                uuid_list = list(chain.from_iterable(key_dict.values()))
+                action_worker = DeviceModeCli(
+                    api.post(DeviceModeCli.api_params(device_type, *uuid_list), DeviceModeCli.api_path.post)
+                )
+                wait_list.append((action_worker, ', '.join(key_dict)))
+                self.log_debug(f'Device template attach requested: {action_worker.uuid}')
 
-        for template_id, template_name in template_iter:
-            devices_attached = DeviceTemplateAttached.get(api, template_id)
-            if devices_attached is None:
-                self.log_warning(f'Failed to retrieve {template_name} attached devices from vManage')
-                continue
-            for device_id, personality in devices_attached:
-                if device_id in devices_map:
-                    group.send((personality, template_name, device_id))
-        group.send(None)
+            if wait_list:
+                self.wait_actions(api, wait_list, log_context, raise_on_failure)
 
-        return len(detach_reqs)
+        return detach_reqs
 
     def cfg_group_dissociate(self, api: Rest, cfg_group_iter: Iterable[tuple[str, str]],
                              devices_map: Optional[Mapping[str, str]] = None, *,
@@ -717,46 +871,46 @@ class Task:
         @return: Number of associate delete requests processed
         """
 
-        def grouper(request_list):
-            while True:
-                section_dict = yield from chopper(chunk_size)
-                if not section_dict:
-                    continue
-
-                wait_list = []
-                for group_id, key_dict in section_dict.items():
-                    request_list.append(...)
-                    self.log_info(f'Config-group dissociate: {request_details(key_dict, devices_map)}')
-
-                    if self.is_dryrun:
-                        continue
+        if devices_map is None:
+            devices_map = self.devices_map(api)
 
-                    uuid_iter = (uuid for device_id_list in key_dict.values() for uuid in device_id_list)
-                    action_worker = ConfigGroupAssociated.delete_raise(api, uuid_iter, configGroupId=group_id)
-                    wait_list.append((action_worker, ', '.join(key_dict)))
-                    self.log_debug(f'Config-group device dissociate requested: {action_worker.uuid}')
+        def associated_devices(cfg_group_entry: tuple[str, str]) -> tuple[str, str, Optional[ConfigGroupAssociated]]:
+            config_grp_id, config_grp_name = cfg_group_entry
+            return config_grp_id, config_grp_name, ConfigGroupAssociated.get(api, configGroupId=config_grp_id)
 
-                if wait_list:
-                    self.wait_actions(api, wait_list, log_context, raise_on_failure)
+        def dissociate_entry_iter(associated_iter: Iterable[tuple[str, str, Optional[ConfigGroupAssociated]]]):
+            for config_grp_id, config_grp_name, devices_associated in associated_iter:
+                if devices_associated is None:
+                    self.log_warning(f'Failed to retrieve {config_grp_name} associated devices from vManage')
+                    continue
+                for device_id in devices_associated.filter(not_by_rule=True).uuids:
+                    if device_id in devices_map:
+                        yield config_grp_id, config_grp_name, device_id
+
+        # Associated devices are retrieved before any dissociate request, so that this thread pool is not running
+        # concurrently with the one from wait_actions
+        with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+            associated_iter = executor.map(associated_devices, cfg_group_iter)
+
+        dissociate_reqs = 0
+        for section_dict in chopped_iter(dissociate_entry_iter(associated_iter), chunk_size):
+            wait_list = []
+            for group_id, key_dict in section_dict.items():
+                dissociate_reqs += 1
+                self.log_info('Config-group dissociate: %s', LazyStr(request_details, key_dict, devices_map))
 
-        dissociate_reqs = []
-        group = grouper(dissociate_reqs)
-        next(group)
+                if self.is_dryrun:
+                    continue
 
-        if devices_map is None:
-            devices_map = dict(device_iter(api, default=None))
+                uuid_list = list(chain.from_iterable(key_dict.values()))
+                action_worker = ConfigGroupAssociated.delete_raise(api, uuid_list, configGroupId=group_id)
+                wait_list.append((action_worker, ', '.join(key_dict)))
+                self.log_debug(f'Config-group device dissociate requested: {action_worker.uuid}')
 
-        for config_grp_id, config_grp_name in cfg_group_iter:
-            devices_associated = ConfigGroupAssociated.get(api, configGroupId=config_grp_id)
-            if devices_associated is None:
-                self.log_warning(f'Failed to retrieve {config_grp_name} associated devices from vManage')
-                continue
-            for device_id in devices_associated.filter(not_by_rule=True).uuids:
-                if device_id in devices_map:
-                    group.send((config_grp_id, config_grp_name, device_id))
-        group.send(None)
+            if wait_list:
+                self.wait_actions(api, wait_list, log_context, raise_on_failure)
 
-        return len(dissociate_reqs)
+        return dissociate_reqs
 
     def cfg_group_rules_delete(self, api: Rest, cfg_group_iter: Iterable[tuple[str, str]]) -> int:
         """
@@ -844,7 +998,8 @@ class Task:
 
         return len(deactivate_reqs)
 
-    def wait_actions(self, api: Rest, action_list: list[tuple], log_context: str, raise_on_failure: bool) -> bool:
+    def wait_actions(self, api: Rest, action_list: list[tuple], log_context: str, raise_on_failure: bool, *,
+                     min_interval: Optional[float] = None, max_interval: Optional[float] = None) -> bool:
         """
         Wait for actions in action_list to complete
         @param api: Instance of Rest API
@@ -853,40 +1008,69 @@ class Task:
                             case no messages are logged for individual actions.
         @param log_context: String providing context to log messages
         @param raise_on_failure: If True, raise exception on action failures
+        @param min_interval: Initial polling interval in seconds. Default is Task.ACTION_MIN_INTERVAL.
+        @param max_interval: Polling interval ceiling in seconds. Default is Task.ACTION_INTERVAL.
         @return: True if all actions completed with success. False otherwise.
         """
 
         def upper_first(input_string):
-            return input_string[0].upper() + input_string[1:] if len(input_string) > 0 else ''
+            return input_string[:1].upper() + input_string[1:]
+
+        def action_status(action_entry: tuple) -> Optional[ActionStatus]:
+            action_worker, _ = action_entry
+            return ActionStatus.get(api, action_worker.uuid)
 
         self.log_info(upper_first(log_context))
         result_list = []
-        time_budget = Task.ACTION_TIMEOUT
-        for action_worker, action_info in action_list:
+        min_interval = Task.ACTION_MIN_INTERVAL if min_interval is None else min_interval
+        max_interval = Task.ACTION_INTERVAL if max_interval is None else max_interval
+        # Polling interval starts at min_interval and doubles while no action completes, up to max_interval
+        interval = min_interval
+        deadline = time.monotonic() + Task.ACTION_TIMEOUT
+
+        # Actions are polled together on each interval, so that actions progressing in parallel on vManage are not
+        # waited on one after the other
+        pending_list = list(action_list)
+        pool_size = max(min(len(pending_list), Task.ACTION_POOL_SIZE), 1)
+        with futures.ThreadPoolExecutor(pool_size) as executor:
             while True:
-                action = ActionStatus.get(api, action_worker.uuid)
-                if action is None:
-                    self.log_warning('Failed to retrieve action status from vManage')
-                    result_list.append(False)
-                    break
+                still_pending_list = []
+                for action_entry, action in zip(pending_list, executor.map(action_status, pending_list)):
+                    if action is None:
+                        self.log_warning('Failed to retrieve action status from vManage')
+                        result_list.append(False)
+                        continue
+
+                    if not action.is_completed:
+                        still_pending_list.append(action_entry)
+                        continue
 
-                if action.is_completed:
                     result_list.append(action.is_successful)
+                    _, action_info = action_entry
                     if action_info is not None:
                         if action.is_successful:
                             self.log_info(f'Completed {action_info}')
                         else:
                             self.log_warning(f'Failed {action_info}: {action.activity_details}')
 
+                if not still_pending_list:
                     break
 
-                time_budget -= Task.ACTION_INTERVAL
-                if time_budget > 0:
-                    self.log_info('Waiting...')
-                    time.sleep(Task.ACTION_INTERVAL)
+                if len(still_pending_list) < len(pending_list):
+                    interval = min_interval
+                pending_list = still_pending_list
+
+                if time.monotonic() + interval < deadline:
+                    # Shorter polls are logged at debug level, so info logs (and savings) match the fixed interval
+                    if interval < max_interval:
+                        self.log_debug('Waiting...')
+                    else:
+                        self.log_info('Waiting...')
+                    time.sleep(interval)
+                    interval = min(2 * interval, max_interval)
                 else:
                     self.log_warning('Wait time limit expired')
-                    result_list.append(False)
+                    result_list.extend(False for _ in pending_list)
                     break
 
         result = all(result_list)
@@ -910,22 +1094,40 @@ class WaitActionsException(TaskException):
     pass
 
 
-def chopper(section_size: int):
+def chopped_iter(data_iter: Iterable[tuple], section_size: int) -> Iterator[dict[str, dict[str, list]]]:
+    """
+    Group data entries into sections of up to section_size entries
+    @param data_iter: Iterable of (<primary key>, <secondary key>, <item>) tuples
+    @param section_size: Maximum number of items per section
+    @return: Iterator of sections, each in the format {<primary key>: {<secondary key>: [<item>, ...]}}
+    """
     section = {}
-    for _ in range(section_size):
-        data = yield
-        if data is None:
-            break
-        primary_key, secondary_key, item = data
+    section_count = 0
+    for primary_key, secondary_key, item in data_iter:
         section.setdefault(primary_key, {}).setdefault(secondary_key, []).append(item)
-    return section
+        section_count += 1
+        if section_count == section_size:
+            yield section
+            section = {}
+            section_count = 0
+
+    if section:
+        yield section
 
 
 def request_details(secondary_dict: Mapping[str, Sequence[str]], devices_map: Mapping[str, str]) -> str:
-    return ', '.join(
-        f"{secondary_key} ({', '.join(devices_map.get(item) or item for item in item_list)})"
+    # devices_map may contain None values (i.e. device_iter with default=None), fall back to the item itself
+    return ', '.join([
+        f"{secondary_key} ({', '.join([devices_map.get(item) or item for item in item_list])})"
         for secondary_key, item_list in secondary_dict.items()
-    )
+    ])
+
+
+def attach_request_details(section_dict: Mapping[str, Mapping[str, Sequence]]) -> str:
+    return ', '.join([
+        f"{template_name} ({', '.join(DeviceTemplateValues.input_list_devices(input_list))})"
+        for template_name, key_dict in section_dict.items() for input_list in key_dict.values()
+    ])
 
 
 def device_iter(api: Rest,
@@ -944,11 +1146,12 @@ def device_iter(api: Rest,
     @param default: Optional default value used for Device iter absent fields
     @return: Iterator of (<device-uuid>, <device-name>) tuples.
     """
+    name_pattern = re.compile(match_name_regex) if match_name_regex is not None else None
     return (
         (uuid, name)
         for uuid, name, system_ip, site_id, reachability, *_ in Device.get_raise(api).extended_iter(default=default)
         if (
-            (match_name_regex is None or regex_search(match_name_regex, name)) and
+            (name_pattern is None or name_pattern.search(name) is not None) and
             (not match_reachable or reachability == 'reachable') and
             (match_site_id is None or site_id == match_site_id) and
             (match_system_ip is None or system_ip == match_system_ip)
@@ -956,6 +1159,22 @@ def device_iter(api: Rest,
     )
 
 
+def retrieve_item_task(api: Rest, item_cls: type[ConfigItem],
+                       item_entry: tuple[str, str]) -> tuple[str, str, Union[ConfigItem, Exception]]:
+    """
+    Retrieve a config item, for use with executor.map.
+    @param api: Instance of Rest API
+    @param item_cls: ConfigItem subclass to retrieve
+    @param item_entry: (<item-id>, <item-name>) tuple
+    @return: (<item-id>, <item-name>, <item>) tuple. Where <item> is the exception raised if the item retrieval failed.
+    """
+    item_id, item_name = item_entry
+    try:
+        return item_id, item_name, item_cls.get_raise(api, item_id)
+    except (RestAPIException, ModelException, ValueError) as ex:
+        return item_id, item_name, ex
+
+
 def clean_dir(target_dir_name: str, max_saved: int = 99) -> Union[str, bool]:
     """
     Clean target_dir_name directory if it exists. If max_saved is non-zero and target_dir_name exists, move it to a new
@@ -966,14 +1185,19 @@ def clean_dir(target_dir_name: str, max_saved: int = 99) -> Union[str, bool]:
     target_dir = Path(DATA_DIR, target_dir_name)
     if target_dir.exists():
         if max_saved > 0:
-            save_seq = range(max_saved)
-            for elem in save_seq:
-                save_path = Path(DATA_DIR, f'{target_dir_name}_{elem + 1}')
-                if elem == save_seq[-1]:
-                    rmtree(save_path, ignore_errors=True)
-                if not save_path.exists():
-                    target_dir.rename(save_path)
-                    return save_path.name
+            # Single directory read to find which sequence numbers are already in use
+            seq_regex = re.compile(rf'{re.escape(target_dir.name)}_(\d+)')
+            with os.scandir(target_dir.parent) as dir_entries:
+                used_seq = {
+                    int(seq_match.group(1)) for entry in dir_entries
+                    if (seq_match := seq_regex.fullmatch(entry.name)) is not None
+                }
+            save_seq = next((seq for seq in range(1, max_saved + 1) if seq not in used_seq), max_saved)
+            save_path = Path(DATA_DIR, f'{target_dir_name}_{save_seq}')
+            if save_seq in used_seq:
+                rmtree(save_path, ignore_errors=True)
+            target_dir.rename(save_path)
+            return save_path.name
         else:
             rmtree(target_dir, ignore_errors=True)
 
@@ -986,9 +1210,17 @@ def export_json(table_iter: Iterable[Table], filename: str) -> None:
     @param table_iter: Tables to export
     @param filename: Name for the export file
     """
+    # Tables are encoded one at a time, output is the same as json.dump of the list of table dicts with indent=2
+    encoder = json.JSONEncoder(indent=2)
     with open(filename, 'w') as export_file:
-        data = [table.dict() for table in table_iter]
-        json.dump(data, export_file, indent=2)
+        export_file.write('[')
+        is_empty = True
+        for table in table_iter:
+            export_file.write('\n  ' if is_empty else ',\n  ')
+            for chunk in encoder.iterencode(table.dict()):
+                export_file.write(chunk.replace('\n', '\n  '))
+            is_empty = False
+        export_file.write(']' if is_empty else '\n]')
 
 
 def archive_create(archive_filename: str, workdir: str) -> None:
@@ -999,8 +1231,11 @@ def archive_create(archive_filename: str, workdir: str) -> None:
     """
     source_dir = Path(DATA_DIR, workdir)
     with ZipFile(archive_filename, mode='w', compression=ZIP_DEFLATED) as archive_file:
-        for member_path in source_dir.rglob("*"):
-            archive_file.write(member_path, arcname=member_path.relative_to(source_dir))
+        # os.walk is scandir based, avoiding the extra stat calls from Path.rglob
+        for dir_path, dir_names, file_names in os.walk(source_dir):
+            for member_name in dir_names + file_names:
+                member_path = os.path.join(dir_path, member_name)
+                archive_file.write(member_path, arcname=os.path.relpath(member_path, source_dir))
 
 
 def archive_extract(archive_filename: str, workdir: str) -> None:
@@ -1,5 +1,8 @@
 import argparse
+import re
 from typing import Union, Optional
+from functools import partial
+from concurrent import futures
 from pydantic import model_validator, field_validator
 from uuid import uuid4
 from cisco_sdwan.__version__ import __doc__ as title
@@ -10,11 +13,32 @@ from cisco_sdwan.base.models_vmanage import (DeviceConfig, DeviceConfigRFS, Devi
                                              DeviceTemplateValues, EdgeInventory, ControlInventory, EdgeCertificate,
                                              ConfigGroup, ConfigGroupValues, ConfigGroupAssociated)
 from cisco_sdwan.tasks.utils import TaskOptions, TagOptions, filename_type, regex_type, default_workdir
-from cisco_sdwan.tasks.common import regex_search, clean_dir, Task, archive_create
+from cisco_sdwan.tasks.common import regex_search, clean_dir, Task, archive_create, retrieve_item_task
 from cisco_sdwan.tasks.models import TaskArgs, CatalogTag
 from cisco_sdwan.tasks.validators import validate_regex, validate_filename
 
 
+def retrieve_template_values_task(api_obj: Rest, template_entry: tuple[str, str]) -> tuple[
+        str, str, Optional[DeviceTemplateAttached], Union[DeviceTemplateValues, Exception, None]]:
+    template_id, template_name = template_entry
+    devices_attached = DeviceTemplateAttached.get(api_obj, template_id)
+    if devices_attached is None or devices_attached.is_empty:
+        return template_id, template_name, devices_attached, None
+    try:
+        values = DeviceTemplateValues(api_obj.post(DeviceTemplateValues.api_params(template_id, devices_attached.uuids),
+                                                   DeviceTemplateValues.api_path.post))
+    except RestAPIException as ex:
+        return template_id, template_name, devices_attached, ex
+
+    return template_id, template_name, devices_attached, values
+
+
+def retrieve_config_task(api_obj: Rest, device_entry: tuple[str, str]) -> tuple[str, str, tuple]:
+    uuid, hostname = device_entry
+    return uuid, hostname, ((DeviceConfig.get(api_obj, DeviceConfig.api_params(uuid)), 'CFS'),
+                            (DeviceConfigRFS.get(api_obj, DeviceConfigRFS.api_params(uuid)), 'RFS'))
+
+
 @TaskOptions.register('backup')
 class TaskBackup(Task):
     @staticmethod
@@ -77,6 +101,9 @@ class TaskBackup(Task):
                 self.log_info('Saved WAN edge certificates')
 
         # Backup items registered to the catalog
+        regex = parsed_args.regex or parsed_args.not_regex
+        if regex is not None:
+            regex = re.compile(regex)
         for _, info, index_cls, item_cls in catalog_iter(*parsed_args.tags, version=api.server_version):
             item_index = index_cls.get(api)
             if item_index is None:
@@ -85,23 +112,46 @@ class TaskBackup(Task):
             if item_index.save(parsed_args.workdir):
                 self.log_info(f'Saved {info} index')
 
-            regex = parsed_args.regex or parsed_args.not_regex
-            matched_item_iter = (
+            matched_item_iter = item_index if regex is None else (
                 (item_id, item_name) for item_id, item_name in item_index
-                if regex is None or regex_search(regex, item_name, inverse=parsed_args.regex is None)
+                if regex_search(regex, item_name, inverse=parsed_args.regex is None)
             )
-            for item_id, item_name in matched_item_iter:
-                try:
-                    item = item_cls.get_raise(api, item_id)
-                    if item.save(parsed_args.workdir, item_index.need_extended_name, item_name, item_id):
-                        self.log_info(f'Done {info} {item_name}')
-                except (RestAPIException, ModelException, ValueError) as ex:
-                    self.log_error(f'Failed backup {info} {item_name}: {ex}')
-                    continue
+            # Items are retrieved concurrently, they are saved as results come in
+            template_entry_list = []
+            with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+                item_result_iter = executor.map(partial(retrieve_item_task, api, item_cls), matched_item_iter)
+                for item_id, item_name, item in item_result_iter:
+                    if isinstance(item, Exception):
+                        self.log_error(f'Failed backup {info} {item_name}: {item}')
+                        continue
+                    try:
+                        if item.save(parsed_args.workdir, item_index.need_extended_name, item_name, item_id):
+                            self.log_info(f'Done {info} {item_name}')
+                    except (ModelException, ValueError) as ex:
+                        self.log_error(f'Failed backup {info} {item_name}: {ex}')
+                        continue
 
-                # Special case for DeviceTemplate, handle DeviceTemplateAttached and DeviceTemplateValues
-                if isinstance(item, DeviceTemplate):
-                    devices_attached = DeviceTemplateAttached.get(api, item_id)
+                    # Special case for DeviceTemplate, DeviceTemplateAttached and DeviceTemplateValues handled below
+                    if isinstance(item, DeviceTemplate):
+                        template_entry_list.append((item_id, item_name))
+
+                    # Special case for ConfigGroup, handle ConfigGroupAssociated, ConfigGroupValues, ConfigGroupRules
+                    # TODO: Review post 20.13
+                    if isinstance(item, ConfigGroup) and item.devices_associated:
+                        for sub_item_info, sub_item_cls in (('associated devices', ConfigGroupAssociated),
+                                                            # ('automated rules', ConfigGroupRules),
+                                                            ('values', ConfigGroupValues)):
+                            sub_item = sub_item_cls.get(api, configGroupId=item_id)
+                            if sub_item is None:
+                                self.log_error(f'Failed backup {info} {item_name} {sub_item_info}')
+                                continue
+                            if sub_item.save(parsed_args.workdir, item_index.need_extended_name, item_name, item_id):
+                                self.log_info(f'Done {info} {item_name} {sub_item_info}')
+
+            # Attached devices and values from device templates are retrieved concurrently, saved as results come in
+            with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+                template_result_iter = executor.map(partial(retrieve_template_values_task, api), template_entry_list)
+                for item_id, item_name, devices_attached, values in template_result_iter:
                     if devices_attached is None:
                         self.log_error(f'Failed backup {info} {item_name} attached devices')
                         continue
@@ -111,27 +161,11 @@ class TaskBackup(Task):
                         self.log_debug(f'Skipped {info} {item_name} attached devices, none found')
                         continue
 
-                    try:
-                        uuid_list = [uuid for uuid, _ in devices_attached]
-                        values = DeviceTemplateValues(api.post(DeviceTemplateValues.api_params(item_id, uuid_list),
-                                                               DeviceTemplateValues.api_path.post))
-                        if values.save(parsed_args.workdir, item_index.need_extended_name, item_name, item_id):
-                            self.log_info(f'Done {info} {item_name} values')
-                    except RestAPIException as ex:
-                        self.log_error(f'Failed backup {info} {item_name} values: {ex}')
-
-                # Special case for ConfigGroup, handle ConfigGroupAssociated, ConfigGroupValues, ConfigGroupRules
-                # TODO: Review post 20.13
-                if isinstance(item, ConfigGroup) and item.devices_associated:
-                    for sub_item_info, sub_item_cls in (('associated devices', ConfigGroupAssociated),
-                                                        # ('automated rules', ConfigGroupRules),
-                                                        ('values', ConfigGroupValues)):
-                        sub_item = sub_item_cls.get(api, configGroupId=item_id)
-                        if sub_item is None:
-                            self.log_error(f'Failed backup {info} {item_name} {sub_item_info}')
-                            continue
-                        if sub_item.save(parsed_args.workdir, item_index.need_extended_name, item_name, item_id):
-                            self.log_info(f'Done {info} {item_name} {sub_item_info}')
+                    if isinstance(values, Exception):
+                        self.log_error(f'Failed backup {info} {item_name} values: {values}')
+                        continue
+                    if values.save(parsed_args.workdir, item_index.need_extended_name, item_name, item_id):
+                        self.log_info(f'Done {info} {item_name} values')
 
         if parsed_args.archive:
             archive_create(parsed_args.archive, parsed_args.workdir)
@@ -151,18 +185,23 @@ class TaskBackup(Task):
                 self.log_error(f'Failed retrieving {info} inventory')
                 continue
 
+            device_entry_list = []
             for uuid, _, hostname, _ in inventory.extended_iter():
                 if hostname is None:
                     self.log_debug(f'Skipping {uuid}, no hostname')
                     continue
-
-                for item, config_type in ((DeviceConfig.get(api, DeviceConfig.api_params(uuid)), 'CFS'),
-                                          (DeviceConfigRFS.get(api, DeviceConfigRFS.api_params(uuid)), 'RFS')):
-                    if item is None:
-                        self.log_error(f'Failed backup {config_type} device configuration {hostname}')
-                        continue
-                    if item.save(workdir, item_name=hostname, item_id=uuid):
-                        self.log_info(f'Done {config_type} device configuration {hostname}')
+                device_entry_list.append((uuid, hostname))
+
+            # Running configs are retrieved concurrently, they are saved as results come in
+            with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+                config_result_iter = executor.map(partial(retrieve_config_task, api), device_entry_list)
+                for uuid, hostname, config_list in config_result_iter:
+                    for item, config_type in config_list:
+                        if item is None:
+                            self.log_error(f'Failed backup {config_type} device configuration {hostname}')
+                            continue
+                        if item.save(workdir, item_name=hostname, item_id=uuid):
+                            self.log_info(f'Done {config_type} device configuration {hostname}')
 
 
 class BackupArgs(TaskArgs):
@@ -1,4 +1,5 @@
 import argparse
+import re
 from typing import Union, Optional
 from collections.abc import Callable
 from pydantic import field_validator, model_validator
@@ -56,7 +57,7 @@ class TaskCertificate(Task):
         if saved_certs is None:
             raise FileNotFoundError('WAN edge certificates were not found in the backup')
 
-        saved_certs_dict = {uuid: status for uuid, status in saved_certs}
+        saved_certs_dict = dict(saved_certs)
 
         return (
             (uuid, status, hostname, saved_certs_dict[uuid])
@@ -84,6 +85,7 @@ class TaskCertificate(Task):
             target_certs = EdgeCertificate.get_raise(api)
 
             regex = parsed_args.regex or parsed_args.not_regex
+            regex = re.compile(regex) if regex is not None else None
             matched_items = (
                 (uuid, current_status, hostname, new_status)
                 for uuid, current_status, hostname, new_status in parsed_args.source_iter(target_certs, parsed_args)
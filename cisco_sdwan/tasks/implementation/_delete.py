@@ -1,12 +1,15 @@
 import argparse
+import re
 from typing import Union, Optional
+from functools import partial
+from concurrent import futures
 from pydantic import model_validator, field_validator
 from cisco_sdwan.__version__ import __doc__ as title
 from cisco_sdwan.base.rest_api import Rest, RestAPIException
 from cisco_sdwan.base.catalog import catalog_iter, CATALOG_TAG_ALL, ordered_tags, is_index_supported
 from cisco_sdwan.base.models_vmanage import DeviceTemplateIndex, ConfigGroupIndex
 from cisco_sdwan.tasks.utils import TaskOptions, TagOptions, regex_type
-from cisco_sdwan.tasks.common import regex_search, Task, WaitActionsException
+from cisco_sdwan.tasks.common import regex_search, Task, WaitActionsException, retrieve_item_task
 from cisco_sdwan.tasks.models import TaskArgs, CatalogTag
 from cisco_sdwan.tasks.validators import validate_regex
 
@@ -88,33 +91,37 @@ class TaskDelete(Task):
                 self.log_critical(f'Detach failed: {ex}')
                 return
 
+        regex = parsed_args.regex or parsed_args.not_regex
+        if regex is not None:
+            regex = re.compile(regex)
         for tag in ordered_tags(parsed_args.tag, parsed_args.tag != CATALOG_TAG_ALL):
             self.log_info(f'Inspecting {tag} items', dryrun=False)
-            regex = parsed_args.regex or parsed_args.not_regex
-            matched_item_iter = (
-                (item_name, item_id, item_cls, info)
-                for _, info, index, item_cls in self.index_iter(api, catalog_iter(tag, version=api.server_version))
-                for item_id, item_name in index
-                if regex is None or regex_search(regex, item_name, inverse=parsed_args.regex is None)
-            )
-            for item_name, item_id, item_cls, info in matched_item_iter:
-                item = item_cls.get(api, item_id)
-                if item is None:
-                    self.log_warning(f'Failed retrieving {info} {item_name}')
-                    continue
-                if item.is_readonly or item.is_system:
-                    self.log_debug(f'Skipped {"read-only" if item.is_readonly else "system"} {info} {item_name}')
-                    continue
-                if self.is_dryrun:
-                    self.log_info(f'Delete {info} {item_name}')
-                    continue
-
-                try:
-                    api.delete(item_cls.api_path.delete, item_id)
-                except RestAPIException as ex:
-                    self.log_warning(f'Failed: Delete {info} {item_name}: {ex}')
-                else:
-                    self.log_info(f'Done: Delete {info} {item_name}')
+            for _, info, index, item_cls in self.index_iter(api, catalog_iter(tag, version=api.server_version)):
+                matched_item_iter = (
+                    (item_id, item_name) for item_id, item_name in index
+                    if regex is None or regex_search(regex, item_name, inverse=parsed_args.regex is None)
+                )
+                # Items are retrieved concurrently, deletes are done in order
+                with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+                    item_result_iter = executor.map(partial(retrieve_item_task, api, item_cls), matched_item_iter)
+
+                for item_id, item_name, item in item_result_iter:
+                    if isinstance(item, Exception):
+                        self.log_warning(f'Failed retrieving {info} {item_name}: {item}')
+                        continue
+                    if item.is_readonly or item.is_system:
+                        self.log_debug(f'Skipped {"read-only" if item.is_readonly else "system"} {info} {item_name}')
+                        continue
+                    if self.is_dryrun:
+                        self.log_info(f'Delete {info} {item_name}')
+                        continue
+
+                    try:
+                        api.delete(item_cls.api_path.delete, item_id)
+                    except RestAPIException as ex:
+                        self.log_warning(f'Failed: Delete {info} {item_name}: {ex}')
+                    else:
+                        self.log_info(f'Done: Delete {info} {item_name}')
 
         return
 
@@ -1,4 +1,5 @@
 import argparse
+import re
 from typing import Union, Optional
 from collections.abc import Callable
 from operator import itemgetter
@@ -108,7 +109,7 @@ class TaskList(Task):
         version = None if api is None else api.server_version
 
         # Within each tag, table entries are sorted by item_name then item_id. Tag order is defined by the catalog.
-        table = Table('Name', 'ID', 'Tag', 'Type')
+        table = Table('Name', 'ID', 'Tag', 'Type', column_types=(str, str, str, str))
         table.extend(
             (item_name, item_id, tag, info)
             for tag, info, index, item_cls in self.index_iter(backend, catalog_iter(*parsed_args.tags, version=version))
@@ -127,7 +128,7 @@ class TaskList(Task):
             certs = EdgeCertificate.get_raise(api)
 
         # Table will be sorted by hostname then chassis
-        table = Table('Hostname', 'Chassis', 'Serial', 'State', 'Status')
+        table = Table('Hostname', 'Chassis', 'Serial', 'State', 'Status', column_types=(str, str, str, str, str))
         matched_items = [
             (hostname, chassis, serial, EdgeCertificate.state_str(state), status)
             for uuid, status, hostname, chassis, serial, state in certs.extended_iter(default='-')
@@ -146,8 +147,9 @@ class TaskList(Task):
         name_regex = ExtendedTemplate(parsed_args.name_regex)
 
         # Within a given tag, table entries are sorted by item_name. Tag order is defined by the catalog
-        table = Table('Name', 'Transformed', 'Tag', 'Type')
+        table = Table('Name', 'Transformed', 'Tag', 'Type', column_types=(str, str, str, str))
         regex = parsed_args.regex or parsed_args.not_regex
+        regex = re.compile(regex) if regex is not None else None
         matched_items = [
             (item_name, name_regex(item_name), tag, info)
             for tag, info, index, item_cls in self.index_iter(backend, catalog_iter(*parsed_args.tags, version=version))
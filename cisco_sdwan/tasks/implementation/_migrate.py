@@ -85,6 +85,7 @@ class TaskMigrate(Task):
             if server_info.save(parsed_args.output):
                 self.log_info('Saved vManage server information')
 
+            name_template = ExtendedTemplate(parsed_args.name)
             id_mapping = {}  # {<old_id>: <new_id>}
             for tag in ordered_tags(CATALOG_TAG_ALL, reverse=True):
                 self.log_info('Inspecting %s items', tag)
@@ -95,11 +96,11 @@ class TaskMigrate(Task):
                         self.log_debug('Skipped %s, none found', info)
                         continue
 
-                    name_set = {item_name for item_id, item_name in item_index}
+                    id_hint_map = {item_name: item_id for item_id, item_name in item_index}
+                    name_set = set(id_hint_map)
 
                     is_bad_name = False
                     export_list = []
-                    id_hint_map = {item_name: item_id for item_id, item_name in item_index}
                     for item_id, item_name in item_index:
                         item = self.item_get(item_cls, backend, item_id, item_name, item_index.need_extended_name)
                         if item is None:
@@ -116,7 +117,7 @@ class TaskMigrate(Task):
                                 self.log_debug('Skipping %s, migration not necessary', item_name)
                                 raise StopProcessorException()
 
-                            new_name = ExtendedTemplate(parsed_args.name)(item_name)
+                            new_name = name_template(item_name)
                             if not item_cls.is_name_valid(new_name):
                                 self.log_error('New %s name is not valid: %s', info, new_name)
                                 is_bad_name = True
@@ -158,13 +159,15 @@ class TaskMigrate(Task):
                         continue
 
                     if issubclass(item_cls, FeatureTemplate):
+                        export_name_set = {elem.name for elem in export_list}
                         for factory_default in (factory_cedge_aaa, factory_cedge_global):
-                            if any(factory_default.name == elem.name for elem in export_list):
+                            if factory_default.name in export_name_set:
                                 self.log_debug('Using existing factory %s %s', info, factory_default.name)
                                 # Updating because device processor always use the built-in IDs
                                 id_mapping[factory_default.uuid] = id_hint_map[factory_default.name]
                             else:
                                 export_list.append(factory_default)
+                                export_name_set.add(factory_default.name)
                                 id_hint_map[factory_default.name] = factory_default.uuid
                                 self.log_debug('Added factory %s %s', info, factory_default.name)
 
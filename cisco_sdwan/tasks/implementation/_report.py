@@ -12,7 +12,7 @@ from cisco_sdwan.__version__ import __doc__ as title
 from cisco_sdwan.base.rest_api import Rest
 from cisco_sdwan.base.catalog import CATALOG_TAG_ALL, ordered_tags
 from cisco_sdwan.tasks.utils import TaskOptions, existing_workdir_type, filename_type, existing_file_type
-from cisco_sdwan.tasks.common import Task, Table, TaskException
+from cisco_sdwan.tasks.common import Task, Table, TaskException, write_lines
 from cisco_sdwan.tasks.models import TaskArgs, const
 from cisco_sdwan.tasks.validators import validate_existing_file, validate_filename, validate_workdir, validate_json
 from ._list import TaskList, ListConfigArgs, ListCertificateArgs
@@ -150,7 +150,7 @@ class Report:
 
     def save(self) -> None:
         with open(self.filename, 'w') as f:
-            f.write(str(self))
+            write_lines(f, self.render())
 
     @classmethod
     def load(cls, filename: str):
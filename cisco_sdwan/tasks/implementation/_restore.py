@@ -1,13 +1,16 @@
 import argparse
+import re
 from typing import Union, Optional
-from collections.abc import Sequence
+from collections.abc import Sequence, Iterator
+from functools import partial
+from concurrent import futures
 from pydantic import model_validator, field_validator
 from uuid import uuid4
 from contextlib import suppress
 from cisco_sdwan.__version__ import __doc__ as title
 from cisco_sdwan.base.rest_api import Rest, RestAPIException, is_version_newer, response_id
 from cisco_sdwan.base.catalog import catalog_iter, CATALOG_TAG_ALL, ordered_tags, is_index_supported
-from cisco_sdwan.base.models_base import UpdateEval, ServerInfo, ModelException
+from cisco_sdwan.base.models_base import UpdateEval, ServerInfo, ModelException, IndexConfigItem
 from cisco_sdwan.base.models_vmanage import (DeviceTemplateIndex, PolicyVsmartIndex, EdgeInventory, ControlInventory,
                                              CheckVBond, FeatureProfile, ConfigGroupIndex)
 from cisco_sdwan.tasks.utils import (TaskOptions, TagOptions, regex_type, default_workdir, existing_workdir_type,
@@ -17,6 +20,34 @@ from cisco_sdwan.tasks.models import TaskArgs, CatalogTag, validate_workdir_cond
 from cisco_sdwan.tasks.validators import validate_regex, validate_zip_file
 
 
+def retrieve_index_task(api_obj: Rest,
+                        index_entry: tuple[str, type[IndexConfigItem]]) -> tuple[str, Optional[IndexConfigItem]]:
+    info, index_cls = index_entry
+    return info, index_cls.get(api_obj)
+
+
+def target_item_iter(api_obj: Rest, restore_item_list: Sequence[tuple]) -> Iterator[tuple]:
+    """
+    Iterate over restore_item_list entries, adding to each the future retrieving its current target item. Future is
+    None for entries that are not updates. The target item of the next update is retrieved while the current entry is
+    processed.
+    """
+    with futures.ThreadPoolExecutor(1) as executor:
+        update_iter = (
+            (item_id, executor.submit(item.get_raise, api_obj, target_id))
+            for item_id, item, target_id in restore_item_list
+            if target_id is not None and not item.is_readonly
+        )
+        next_update = next(update_iter, None)
+        for item_id, item, target_id in restore_item_list:
+            target_item_future = None
+            if next_update is not None and next_update[0] == item_id:
+                target_item_future = next_update[1]
+                next_update = next(update_iter, None)
+
+            yield item_id, item, target_id, target_item_future
+
+
 @TaskOptions.register('restore')
 class TaskRestore(Task):
     @staticmethod
@@ -81,19 +112,34 @@ class TaskRestore(Task):
             self.log_warning(f'Target vManage release ({api.server_version}) is older than the release used in backup '
                              f'({local_info.server_version}). Items may fail to restore due to incompatibilities.')
 
-        is_vbond_set = self.is_vbond_configured(api)
-
         self.log_info('Loading existing items from target vManage', dryrun=False)
-        target_all_items_map = {
-            hash(type(index)): {item_name: item_id for item_id, item_name in index}
-            for _, _, index, item_cls in self.index_iter(api, catalog_iter(CATALOG_TAG_ALL, version=api.server_version))
-        }
+        # Only indexes from tags being restored are needed. They are retrieved concurrently, together with the vBond
+        # configuration status.
+        target_index_entries = [
+            (info, index_cls)
+            for tag in ordered_tags(parsed_args.tag)
+            for _, info, index_cls, _ in catalog_iter(tag, version=api.server_version)
+        ]
+        with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+            is_vbond_set_future = executor.submit(self.is_vbond_configured, api)
+            target_index_iter = executor.map(partial(retrieve_index_task, api), target_index_entries)
+
+        is_vbond_set = is_vbond_set_future.result()
+
+        target_all_items_map = {}
+        for info, index in target_index_iter:
+            self.log_debug(f'{"No" if index is None else "Loaded"} remote {info} index')
+            if index is not None:
+                target_all_items_map[type(index)] = {item_name: item_id for item_id, item_name in index}
 
         self.log_info('Identifying items to be pushed', dryrun=False)
         id_mapping = {}  # {<old_id>: <new_id>}, used to replace old (saved) item ids with new (target) ids
         restore_list = []  # [ (<info>, <index_cls>, [(<item_id>, <item>, <id_on_target>), ...]), ...]
         dependency_set = set()  # {<item_id>, ...}
         match_set = set()  # {<item_id>, ...}
+        regex = parsed_args.regex or parsed_args.not_regex
+        if regex is not None:
+            regex = re.compile(regex)
         for tag in ordered_tags(parsed_args.tag):
             if tag == 'template_device' and not is_vbond_set:
                 self.log_warning(f'Will skip {tag} items because vBond is not configured. '
@@ -107,7 +153,7 @@ class TaskRestore(Task):
                                                                 catalog_iter(tag, version=api.server_version))
             )
             for info, index, loaded_items_iter in tag_iter:
-                target_item_map = target_all_items_map.get(hash(type(index)))
+                target_item_map = target_all_items_map.get(type(index))
                 if target_item_map is None:
                     # Logging at warning level because the backup files did have this item
                     self.log_warning(f'Will skip {info}, item not supported by target vManage')
@@ -126,7 +172,6 @@ class TaskRestore(Task):
                             self.log_debug(f'Will skip {info} {item.name}, item already on target vManage')
                             continue
 
-                    regex = parsed_args.regex or parsed_args.not_regex
                     item_matches = (
                             not item.is_readonly and
                             (parsed_args.tag == CATALOG_TAG_ALL or parsed_args.tag == tag) and
@@ -184,7 +229,7 @@ class TaskRestore(Task):
         for info, index, restore_item_list in reversed(restore_list):
             pushed_item_dict = {}
             parcel_id_mapping = {}
-            for item_id, item, target_id in restore_item_list:
+            for item_id, item, target_id, target_item_future in target_item_iter(api, restore_item_list):
                 op_info = 'Create' if target_id is None else 'Update'
                 reason = ' (dependency)' if item_id in dependency_set - match_set else ''
 
@@ -230,7 +275,7 @@ class TaskRestore(Task):
                             continue
 
                         update_data = item.put_data(id_mapping)
-                        if item.get_raise(api, target_id).is_equal(update_data):
+                        if target_item_future.result().is_equal(update_data):
                             self.log_debug(f'{op_info} skipped (no diffs) {info} {item.name}')
                             continue
 
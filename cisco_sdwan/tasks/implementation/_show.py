@@ -20,7 +20,6 @@ from cisco_sdwan.tasks.common import regex_search, Task, Table, get_table_filter
 from cisco_sdwan.tasks.models import TableTaskArgs, validate_op_cmd, const
 from cisco_sdwan.tasks.validators import validate_site_id, validate_ipv4, validate_regex
 
-THREAD_POOL_SIZE = 10
 TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
 
@@ -166,7 +165,7 @@ class TaskShow(Task):
 
     def realtime(self, parsed_args, api: Rest) -> list[Table]:
         devices = self.selected_devices(parsed_args, api)
-        pool_size = max(min(len(devices), THREAD_POOL_SIZE), 1)
+        pool_size = max(min(len(devices), Task.FETCH_POOL_SIZE), 1)
 
         result_tables = []
         for info, rt_cls in op_catalog_iter(OpType.RT, *parsed_args.cmd, version=api.server_version):
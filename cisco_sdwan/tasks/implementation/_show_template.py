@@ -1,14 +1,18 @@
 import argparse
+import re
 from pathlib import Path
 from collections import namedtuple
 from typing import Union, Optional
 from collections.abc import Callable
+from functools import partial
+from concurrent import futures
+from itertools import repeat
 from operator import itemgetter, attrgetter
 from pydantic import field_validator
 from cisco_sdwan.__version__ import __doc__ as title
 from cisco_sdwan.base.rest_api import RestAPIException, Rest
 from cisco_sdwan.base.catalog import catalog_iter
-from cisco_sdwan.base.models_base import filename_safe
+from cisco_sdwan.base.models_base import filename_safe, ConfigItem
 from cisco_sdwan.base.models_vmanage import (DeviceTemplate, DeviceTemplateAttached, DeviceTemplateValues,
                                              DeviceTemplateIndex, FeatureTemplate, FeatureTemplateIndex)
 from cisco_sdwan.tasks.utils import TaskOptions, existing_workdir_type, filename_type, regex_type
@@ -17,6 +21,27 @@ from cisco_sdwan.tasks.models import TableTaskArgs, const
 from cisco_sdwan.tasks.validators import validate_workdir, validate_regex
 
 
+def retrieve_values_task(api_obj: Rest, template_id: str) -> tuple[Optional[DeviceTemplateAttached],
+                                                                   Optional[DeviceTemplateValues]]:
+    devices_attached = DeviceTemplateAttached.get(api_obj, template_id)
+    if devices_attached is None or devices_attached.is_empty:
+        return devices_attached, None
+
+    try:
+        values = DeviceTemplateValues(api_obj.post(DeviceTemplateValues.api_params(template_id, devices_attached.uuids),
+                                                   DeviceTemplateValues.api_path.post))
+    except RestAPIException:
+        return devices_attached, None
+
+    return devices_attached, values
+
+
+def retrieve_template_task(backend: Union[Rest, str], item_cls: type[ConfigItem], ext_name: bool,
+                           item_entry: tuple[str, str]) -> tuple[str, str, Optional[ConfigItem]]:
+    item_id, item_name = item_entry
+    return item_id, item_name, Task.item_get(item_cls, backend, item_id, item_name, ext_name)
+
+
 @TaskOptions.register('show-template')
 class TaskShowTemplate(Task):
     @staticmethod
@@ -87,24 +112,23 @@ class TaskShowTemplate(Task):
         return result_tables if (parsed_args.save_csv is None and parsed_args.save_json is None) else None
 
     def values_table(self, parsed_args, api: Optional[Rest]) -> list[Table]:
-        def template_values(ext_name: bool, template_name: str, template_id: str) -> Union[DeviceTemplateValues, None]:
+        def template_values(ext_name: bool, template_name: str, template_id: str,
+                            api_result: Optional[tuple]) -> Union[DeviceTemplateValues, None]:
             if api is None:
                 # Load from local backup
                 values = DeviceTemplateValues.load(parsed_args.workdir, ext_name, template_name, template_id)
                 if values is None:
                     self.log_debug(f'Skipped {template_name}. No template values file found.')
             else:
-                # Load from vManage via API
-                devices_attached = DeviceTemplateAttached.get(api, template_id)
+                # Already retrieved from vManage via API
+                devices_attached, values = api_result
                 if devices_attached is None:
                     self.log_error(f'Failed to retrieve {template_name} attached devices')
                     return None
-
-                try:
-                    uuid_list = [uuid for uuid, _ in devices_attached]
-                    values = DeviceTemplateValues(api.post(DeviceTemplateValues.api_params(template_id, uuid_list),
-                                                           DeviceTemplateValues.api_path.post))
-                except RestAPIException:
+                if devices_attached.is_empty:
+                    self.log_debug(f'Skipped {template_name}. No devices attached.')
+                    return None
+                if values is None:
                     self.log_error(f'Failed to retrieve {template_name} values')
                     return None
 
@@ -114,16 +138,26 @@ class TaskShowTemplate(Task):
         # by name then UUID. The values for each device are sorted by the variable name
         result_tables = []
         backend = api or parsed_args.workdir
+        templates_regex = re.compile(parsed_args.templates) if parsed_args.templates is not None else None
         matched_templates = [
             (item_id, item_name, index.need_extended_name, tag, info)
             for tag, info, index, item_cls in self.index_iter(backend, catalog_iter('template_device'))
             for item_id, item_name in index
             if (issubclass(item_cls, DeviceTemplate) and
-                (parsed_args.templates is None or regex_search(parsed_args.templates, item_name, item_id)))
+                (templates_regex is None or regex_search(templates_regex, item_name, item_id)))
         ]
         matched_templates.sort(key=itemgetter(1, 0))
-        for item_id, item_name, use_ext_name, tag, info in matched_templates:
-            attached_values = template_values(use_ext_name, item_name, item_id)
+
+        if api is None:
+            api_result_iter = repeat(None)
+        else:
+            # Attached devices and values are retrieved concurrently, results are processed in template order
+            with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+                api_result_iter = executor.map(partial(retrieve_values_task, api),
+                                               map(itemgetter(0), matched_templates))
+
+        for (item_id, item_name, use_ext_name, tag, info), api_result in zip(matched_templates, api_result_iter):
+            attached_values = template_values(use_ext_name, item_name, item_id, api_result)
             if attached_values is None:
                 continue
 
@@ -148,9 +182,14 @@ class TaskShowTemplate(Task):
         backend = api or parsed_args.workdir
         self.log_info('Inspecting feature templates')
         feature_index = self.index_get(FeatureTemplateIndex, backend)
+        with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+            feature_result_iter = executor.map(
+                partial(retrieve_template_task, backend, FeatureTemplate, feature_index.need_extended_name),
+                feature_index
+            )
+
         feature_dict = {}
-        for item_id, item_name in feature_index:
-            feature = self.item_get(FeatureTemplate, backend, item_id, item_name, feature_index.need_extended_name)
+        for item_id, item_name, feature in feature_result_iter:
             if feature is None:
                 self.log_error(f'Failed to load feature template {item_name}')
                 continue
@@ -159,8 +198,13 @@ class TaskShowTemplate(Task):
 
         self.log_info('Inspecting device templates')
         device_index = self.index_get(DeviceTemplateIndex, backend)
-        for item_id, item_name in device_index:
-            device = self.item_get(DeviceTemplate, backend, item_id, item_name, device_index.need_extended_name)
+        with futures.ThreadPoolExecutor(Task.FETCH_POOL_SIZE) as executor:
+            device_result_iter = executor.map(
+                partial(retrieve_template_task, backend, DeviceTemplate, device_index.need_extended_name),
+                device_index
+            )
+
+        for item_id, item_name, device in device_result_iter:
             if device is None:
                 self.log_error(f'Failed to load device template {item_name}')
                 continue
@@ -178,10 +222,11 @@ class TaskShowTemplate(Task):
         self.log_info('Creating references table')
         # Ordered by feature template name. Then device templates are sorted by template name.
         table = Table('Feature Template', 'Type', 'Devices Attached', 'Device Templates',
-                      meta="template_references.csv")
+                      meta="template_references.csv", column_types=(str, str, str, str))
+        templates_regex = re.compile(parsed_args.templates) if parsed_args.templates is not None else None
         matched_feature_templates = [
             info for info in feature_dict.values()
-            if parsed_args.templates is None or regex_search(parsed_args.templates, info.name)
+            if templates_regex is None or regex_search(templates_regex, info.name)
         ]
         matched_feature_templates.sort(key=attrgetter('name'))
         for feature_info in matched_feature_templates:
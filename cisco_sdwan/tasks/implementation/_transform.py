@@ -88,6 +88,8 @@ class Processor:
     def __init__(self, name: str, recipe: TransformRecipe):
         self.name = name
         self.recipe = recipe
+        self.name_template = (ExtendedTemplate(recipe.name_template.name_regex)
+                              if recipe.name_template is not None else None)
 
     def match(self, name: str, tag: str) -> ProcessorMatch:
         """
@@ -112,7 +114,7 @@ class Processor:
         if self.recipe.name_template is not None:
             regex = self.recipe.name_template.regex or self.recipe.name_template.not_regex
             if regex is None or regex_search(regex, name, inverse=self.recipe.name_template.regex is None):
-                return ProcessorMatch(True, ExtendedTemplate(self.recipe.name_template.name_regex)(name))
+                return ProcessorMatch(True, self.name_template(name))
 
         # Match crypt_updates
         if self.recipe.crypt_updates is not None and name in {rsc.resource_name for rsc in self.recipe.crypt_updates}: